@@ -20,14 +20,11 @@ def create_default_sticker(output_path="stickers/sticker.png", text="Rahul", wid
     # Create directory if it doesn't exist
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
     
-    # Create image with transparent background
+    # Create image (B, G, R start at 0, i.e. black background)
     sticker = np.zeros((height, width, 4), dtype=np.uint8)
     
-    # Fill with black background (you can change this color)
-    sticker[:, :, 0] = 0  # B
-    sticker[:, :, 1] = 0  # G
-    sticker[:, :, 2] = 0  # R
-    sticker[:, :, 3] = 255  # Alpha (fully opaque)
+    # Make background fully opaque (set B, G, R here to change its color)
+    sticker[:, :, 3] = 255  # Alpha
     
     # Add white text
     font = cv2.FONT_HERSHEY_BOLD
@@ -0,0 +1,23 @@
+"""
+OpenCV Configuration Module
+Process-wide OpenCV settings for application entry points.
+"""
+
+import cv2
+import os
+
+
+def configure_opencv(num_threads=None):
+    """
+    Enable OpenCV's SIMD-optimized code paths and set its thread count.
+    Some builds/containers ship with these present but turned off. This
+    changes process-wide OpenCV state, so it is not done on import; call it
+    from the application entry point.
+    
+    Args:
+        num_threads: Number of OpenCV threads (default: CPU count)
+    """
+    if num_threads is None:
+        num_threads = os.cpu_count() or 1
+    cv2.setUseOptimized(True)
+    cv2.setNumThreads(max(1, num_threads))
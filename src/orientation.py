@@ -7,7 +7,7 @@ import cv2
 import numpy as np
 
 
-def calculate_orientation(rect):
+def calculate_orientation(rect, corners=None):
     """
     Calculate orientation angle from minimum area rectangle.
     Returns the angle between the x-axis (horizontal) and the longer side of the box.
@@ -15,6 +15,7 @@ def calculate_orientation(rect):
     Args:
         rect: Tuple from cv2.minAreaRect() containing:
               ((center_x, center_y), (width, height), angle)
+        corners: Precomputed box corners from get_box_corners() (optional)
               
     Returns:
         angle: Rotation angle in degrees (0-90) between x-axis and longer side
@@ -25,21 +26,15 @@ def calculate_orientation(rect):
     (cx, cy), (width, height), min_area_angle = rect
     
     # Get box corners to calculate actual orientation of longest side
-    box_corners = get_box_corners(rect)
+    box_corners = corners if corners is not None else get_box_corners(rect)
     if box_corners is not None:
-        corners = np.array(box_corners, dtype=np.float32)
+        corners = np.asarray(box_corners, dtype=np.float32)
         
-        # Find the longest side
-        # Check all 4 edges
-        edges = []
-        for i in range(4):
-            edge_vec = corners[(i + 1) % 4] - corners[i]
-            edge_length = np.linalg.norm(edge_vec)
-            edges.append((edge_vec, edge_length, i))
-        
-        # Get the longest edge (longer side of the box)
-        longest_edge_info = max(edges, key=lambda x: x[1])
-        longest_edge = longest_edge_info[0]
+        # Find the longest side (longer side of the box)
+        # Edge vectors for all 4 sides at once, compared by squared length
+        edge_vecs = np.roll(corners, -1, axis=0) - corners
+        edge_lengths_sq = np.einsum('ij,ij->i', edge_vecs, edge_vecs)
+        longest_edge = edge_vecs[int(edge_lengths_sq.argmax())]
         
         # Calculate angle of longer side relative to x-axis
         # atan2(y, x) gives angle in radians
@@ -84,7 +79,7 @@ def get_box_corners(rect):
         return None
     
     box = cv2.boxPoints(rect)
-    box = np.int0(box)
+    box = np.rint(box).astype(np.int32, copy=False)
     
     return box
 
@@ -3,15 +3,22 @@ Main Pipeline Script
 Combines all modules to process images and detect sticker placement.
 """
 
+import contextlib
 import cv2
+import functools
+import io
 import numpy as np
 import os
+import struct
 import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
+from config import configure_opencv
 from detect_box import detect_box
 from orientation import calculate_orientation, get_box_center, get_box_corners
 from sticker_position import calculate_sticker_position
@@ -49,6 +56,79 @@ def draw_axes(image, center):
     return image
 
 
+# Rotations smaller than this (in degrees) are not visible and are skipped
+MIN_STICKER_ROTATION = 0.5
+
+
+@functools.lru_cache(maxsize=4)
+def _load_sticker(sticker_path, mtime):
+    """
+    Read a sticker image (cached; mtime is part of the key so edits invalidate it).
+    
+    Args:
+        sticker_path: Path to sticker image file
+        mtime: Modification time of the file
+        
+    Returns:
+        sticker: Sticker image (including alpha channel), or None if unreadable
+    """
+    return cv2.imread(sticker_path, cv2.IMREAD_UNCHANGED)
+
+
+@functools.lru_cache(maxsize=16)
+def _transformed_sticker(sticker_path, mtime, angle, scale):
+    """
+    Load a sticker and apply scaling and rotation (cached).
+    The angle should be discretized by the caller so nearby angles share an entry.
+    The returned array is shared between calls and must not be modified.
+    
+    Args:
+        sticker_path: Path to sticker image file
+        mtime: Modification time of the file
+        angle: Rotation angle in degrees (or None)
+        scale: Scale factor for sticker size
+        
+    Returns:
+        sticker: Transformed sticker image, or None if unreadable
+    """
+    sticker = _load_sticker(sticker_path, mtime)
+    if sticker is None:
+        return None
+    
+    # Rotate sticker if angle is provided and large enough to matter
+    if angle is not None and abs(angle) >= MIN_STICKER_ROTATION:
+        # Scale is folded into the rotation matrix so the sticker is
+        # resampled once, straight from the original image
+        h, w = sticker.shape[:2]
+        center_rot = (w / 2, h / 2)
+        rotation_matrix = cv2.getRotationMatrix2D(center_rot, angle, scale)
+        
+        # Calculate new dimensions after rotation and scaling
+        cos = np.abs(rotation_matrix[0, 0])
+        sin = np.abs(rotation_matrix[0, 1])
+        new_w = int((h * sin) + (w * cos))
+        new_h = int((h * cos) + (w * sin))
+        
+        # Adjust rotation matrix for new center
+        rotation_matrix[0, 2] += (new_w / 2) - center_rot[0]
+        rotation_matrix[1, 2] += (new_h / 2) - center_rot[1]
+        
+        # Rotate sticker
+        # warpAffine handles 3- and 4-channel images alike; a zero border
+        # keeps the area outside the rotated sticker fully transparent
+        sticker = cv2.warpAffine(sticker, rotation_matrix, (new_w, new_h), 
+                                flags=cv2.INTER_LINEAR, 
+                                borderMode=cv2.BORDER_CONSTANT, 
+                                borderValue=(0, 0, 0, 0))
+    elif scale != 1.0:
+        # Resize only
+        h, w = sticker.shape[:2]
+        new_h, new_w = int(h * scale), int(w * scale)
+        sticker = cv2.resize(sticker, (new_w, new_h), interpolation=cv2.INTER_LINEAR)
+    
+    return sticker
+
+
 def overlay_sticker_image(image, sticker_path, position, angle=None, scale=1.0):
     """
     Overlay a sticker image at the specified position with optional rotation.
@@ -75,8 +155,17 @@ def overlay_sticker_image(image, sticker_path, position, angle=None, scale=1.0):
         cv2.circle(image, (sx, sy), 12, (0, 0, 255), 2)
         return image
     
-    # Read sticker image
-    sticker = cv2.imread(sticker_path, cv2.IMREAD_UNCHANGED)
+    # Read, scale and rotate sticker image (cached across calls)
+    # Angle is rounded to 0.1° so similar orientations reuse the same result
+    mtime = os.path.getmtime(sticker_path)
+    if angle is not None and abs(angle) < MIN_STICKER_ROTATION:
+        angle = None
+    if angle is None and scale == 1.0:
+        # Nothing to transform, use the decoded sticker as is
+        sticker = _load_sticker(sticker_path, mtime)
+    else:
+        angle_key = round(float(angle), 1) if angle is not None else None
+        sticker = _transformed_sticker(sticker_path, mtime, angle_key, scale)
     if sticker is None:
         print(f"Warning: Could not read sticker image from {sticker_path}, using default marker")
         sx, sy = position
@@ -84,49 +173,6 @@ def overlay_sticker_image(image, sticker_path, position, angle=None, scale=1.0):
         cv2.circle(image, (sx, sy), 12, (0, 0, 255), 2)
         return image
     
-    # Resize sticker if scale is not 1.0
-    if scale != 1.0:
-        h, w = sticker.shape[:2]
-        new_h, new_w = int(h * scale), int(w * scale)
-        sticker = cv2.resize(sticker, (new_w, new_h), interpolation=cv2.INTER_LINEAR)
-    
-    # Rotate sticker if angle is provided
-    if angle is not None and angle != 0:
-        h, w = sticker.shape[:2]
-        center_rot = (w // 2, h // 2)
-        rotation_matrix = cv2.getRotationMatrix2D(center_rot, angle, 1.0)
-        
-        # Calculate new dimensions after rotation
-        cos = np.abs(rotation_matrix[0, 0])
-        sin = np.abs(rotation_matrix[0, 1])
-        new_w = int((h * sin) + (w * cos))
-        new_h = int((h * cos) + (w * sin))
-        
-        # Adjust rotation matrix for new center
-        rotation_matrix[0, 2] += (new_w / 2) - center_rot[0]
-        rotation_matrix[1, 2] += (new_h / 2) - center_rot[1]
-        
-        # Rotate sticker
-        # Handle alpha channel separately if present
-        if sticker.shape[2] == 4:
-            # Separate alpha channel for proper rotation
-            sticker_rgb = sticker[:, :, :3]
-            sticker_alpha = sticker[:, :, 3:4]
-            rotated_rgb = cv2.warpAffine(sticker_rgb, rotation_matrix, (new_w, new_h), 
-                                        flags=cv2.INTER_LINEAR, 
-                                        borderMode=cv2.BORDER_CONSTANT, 
-                                        borderValue=(0, 0, 0))
-            rotated_alpha = cv2.warpAffine(sticker_alpha, rotation_matrix, (new_w, new_h), 
-                                          flags=cv2.INTER_LINEAR, 
-                                          borderMode=cv2.BORDER_CONSTANT, 
-                                          borderValue=0)
-            sticker = np.dstack([rotated_rgb, rotated_alpha])
-        else:
-            sticker = cv2.warpAffine(sticker, rotation_matrix, (new_w, new_h), 
-                                    flags=cv2.INTER_LINEAR, 
-                                    borderMode=cv2.BORDER_CONSTANT, 
-                                    borderValue=(0, 0, 0))
-    
     # Get sticker dimensions
     sh, sw = sticker.shape[:2]
     sx, sy = position
@@ -169,11 +215,14 @@ def overlay_sticker_image(image, sticker_path, position, angle=None, scale=1.0):
     # Handle alpha channel if present
     if sticker_roi.shape[2] == 4:
         # Sticker has alpha channel - blend with background
-        alpha = sticker_roi[:, :, 3:4].astype(np.float32) / 255.0
-        sticker_rgb = sticker_roi[:, :, :3].astype(np.float32)
-        roi_float = roi.astype(np.float32)
-        # Alpha blending: result = background * (1 - alpha) + foreground * alpha
-        blended = roi_float * (1 - alpha) + sticker_rgb * alpha
+        # Integer math in uint16 (max 255*255 + 127 fits) avoids float buffers
+        alpha = sticker_roi[:, :, 3:4].astype(np.uint16)
+        inv_alpha = np.uint16(255) - alpha
+        # Alpha blending: result = (background * (255 - a) + foreground * a) / 255, rounded
+        blended = roi.astype(np.uint16) * inv_alpha
+        blended += sticker_roi[:, :, :3].astype(np.uint16) * alpha
+        blended += 127
+        blended //= 255
         roi = blended.astype(np.uint8)
     else:
         # No alpha channel, simple overlay (replace pixels)
@@ -185,7 +234,8 @@ def overlay_sticker_image(image, sticker_path, position, angle=None, scale=1.0):
     return image
 
 
-def annotate_image(image, contour, rect, sticker_pos, angle, sticker_path=None):
+def annotate_image(image, contour, rect, sticker_pos, angle, sticker_path=None, corners=None,
+                   copy=True, display_scale=1):
     """
     Draw annotations on the image.
     
@@ -196,11 +246,17 @@ def annotate_image(image, contour, rect, sticker_pos, angle, sticker_path=None):
         sticker_pos: Sticker position (x, y)
         angle: Orientation angle in degrees (relative to x-axis)
         sticker_path: Path to sticker image file (optional)
+        corners: Precomputed box corners from get_box_corners() (optional)
+        copy: Draw on a copy of the image (default: True); pass False to
+              annotate the input image in place
+        display_scale: Factor the image was downscaled by (default: 1); the
+                       printed position is given in original image coordinates
+                       and the sticker is sized relative to the original image
         
     Returns:
         annotated: Annotated image
     """
-    annotated = image.copy()
+    annotated = image.copy() if copy else image
     
     if rect is None:
         return annotated
@@ -213,7 +269,7 @@ def annotate_image(image, contour, rect, sticker_pos, angle, sticker_path=None):
         annotated = draw_axes(annotated, center)
     
     # Draw box outline in red
-    box = get_box_corners(rect)
+    box = corners if corners is not None else get_box_corners(rect)
     if box is not None:
         cv2.drawContours(annotated, [box], 0, (0, 0, 255), 2)  # Red color
     
@@ -221,7 +277,9 @@ def annotate_image(image, contour, rect, sticker_pos, angle, sticker_path=None):
     if sticker_pos is not None:
         if sticker_path:
             # Use sticker image with rotation matching box orientation
-            annotated = overlay_sticker_image(annotated, sticker_path, sticker_pos, angle, scale=0.3)
+            # (sticker size is relative to the original image)
+            annotated = overlay_sticker_image(annotated, sticker_path, sticker_pos, angle,
+                                              scale=0.3 / display_scale)
         else:
             # Fallback to red circle if no sticker image provided
             sx, sy = sticker_pos
@@ -235,103 +293,343 @@ def annotate_image(image, contour, rect, sticker_pos, angle, sticker_path=None):
                    cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 255), 2)
     
     # Draw coordinates (relative to image origin, top-left is (0,0))
+    y_offset = 60 if angle is not None else 30
     if sticker_pos is not None:
-        coord_text = f'Position: ({sticker_pos[0]}, {sticker_pos[1]})'
-        y_offset = 60 if angle is not None else 30
+        x, y = _to_original_point(sticker_pos, display_scale)
+        coord_text = f'Position: ({x}, {y})'
         cv2.putText(annotated, coord_text, (10, y_offset), 
                    cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 255), 2)
+        y_offset += 30
+    
+    # Note when the annotated image is smaller than the original
+    if display_scale != 1:
+        scale_text = f'Image shown at 1/{display_scale} scale (position in original pixels)'
+        cv2.putText(annotated, scale_text, (10, y_offset), 
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 255), 2)
     
     return annotated
 
 
-def process_image(image_path, output_dir=None, sticker_path=None):
+@functools.lru_cache(maxsize=1)
+def _default_sticker_path():
     """
-    Process a single image and detect sticker placement.
+    Find the default sticker in the stickers directory (looked up once per process).
+    
+    Returns:
+        sticker_path: Path to the default sticker image, or None if not found
+    """
+    # Look for sticker in stickers directory relative to script
+    script_dir = Path(__file__).parent.parent
+    default_sticker = script_dir / "stickers" / "sticker.png"
+    if default_sticker.exists():
+        return str(default_sticker)
+    
+    # Try other common formats
+    for ext in ['.jpg', '.jpeg', '.png', '.bmp']:
+        test_path = script_dir / "stickers" / f"sticker{ext}"
+        if test_path.exists():
+            return str(test_path)
+    
+    return None
+
+
+def _to_original_point(point, factor):
+    """
+    Map a point from a 1/factor reduced image back to original pixel coordinates.
+    Pixel i of the reduced image covers original pixels i*factor to
+    (i+1)*factor - 1, so its center maps to i*factor + (factor - 1) / 2.
     
     Args:
-        image_path: Path to input image
-        output_dir: Directory to save annotated image (optional)
-        sticker_path: Path to sticker image file (optional)
+        point: (x, y) in reduced image coordinates
+        factor: Downscale factor of the reduced image
         
     Returns:
-        results: Dictionary with angle, position, and annotated image
+        point: (x, y) in original image coordinates, rounded to integers
     """
-    # Read image
-    image = cv2.imread(image_path)
-    if image is None:
-        print(f"Error: Could not read image from {image_path}")
+    offset = (factor - 1) / 2
+    return (int(round(point[0] * factor + offset)), int(round(point[1] * factor + offset)))
+
+
+# Reduced-resolution decode flags, keyed by downscale factor
+_REDUCED_COLOR_FLAGS = {
+    2: cv2.IMREAD_REDUCED_COLOR_2,
+    4: cv2.IMREAD_REDUCED_COLOR_4,
+    8: cv2.IMREAD_REDUCED_COLOR_8,
+}
+
+
+# JPEG start-of-frame markers (SOF0-SOF15, except DHT, JPG and DAC)
+_JPEG_SOF_MARKERS = set(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def _jpeg_size(image_path):
+    """
+    Read the size of a JPEG image from its header, without decoding it.
+    
+    Args:
+        image_path: Path to image file
+        
+    Returns:
+        size: Tuple (width, height), or None if not a JPEG (or unreadable)
+    """
+    try:
+        with open(image_path, 'rb') as f:
+            if f.read(2) != b'\xff\xd8':
+                return None
+            
+            # Walk the marker segments until the start-of-frame header
+            while True:
+                marker = f.read(2)
+                if len(marker) < 2 or marker[0] != 0xFF:
+                    return None
+                code = marker[1]
+                while code == 0xFF:  # Fill bytes
+                    code = f.read(1)[0]
+                if code == 0x01 or 0xD0 <= code <= 0xD8:  # Markers without a length
+                    continue
+                if code in (0xD9, 0xDA):  # End of image / start of scan
+                    return None
+                
+                length, = struct.unpack('>H', f.read(2))
+                if code in _JPEG_SOF_MARKERS:
+                    _, height, width = struct.unpack('>BHH', f.read(5))
+                    return (width, height)
+                f.seek(length - 2, os.SEEK_CUR)
+    except (OSError, IndexError, struct.error):
         return None
+
+
+def _imread_autoscale(image_path, target_long_side=1280):
+    """
+    Read an image, reducing very large images by a power-of-two factor.
+    Decoding a 12-48 MP photo at full size is wasted work when a smaller
+    image is enough; libjpeg can decode JPEGs at 1/2, 1/4 or 1/8 scale
+    directly. Other formats are decoded fully and then resized by the same
+    factor, so the result does not depend on the file format.
     
-    # Detect box
-    contour, rect, edges = detect_box(image)
+    Args:
+        image_path: Path to input image
+        target_long_side: Smallest acceptable long side after reduction
+        
+    Returns:
+        image: Decoded image (BGR format), or None if it could not be read
+        factor: Downscale factor applied (1, 2, 4 or 8)
+    """
+    # Image size from the JPEG header (no decoding)
+    size = _jpeg_size(image_path)
+    image = None
+    if size is None:
+        image = cv2.imread(image_path)
+        if image is None:
+            return None, 1
+        size = (image.shape[1], image.shape[0])
+    long_side = max(size)
+    
+    # Largest power-of-two reduction that keeps the long side >= target
+    factor = 1
+    while factor < 8 and long_side // (factor * 2) >= target_long_side:
+        factor *= 2
     
-    if rect is None:
-        print(f"Warning: No box detected in {image_path}")
-        return None
+    if image is None:
+        if factor == 1:
+            return cv2.imread(image_path), 1
+        return cv2.imread(image_path, _REDUCED_COLOR_FLAGS[factor]), factor
+    
+    if factor != 1:
+        reduced_size = (size[0] // factor, size[1] // factor)
+        image = cv2.resize(image, reduced_size, interpolation=cv2.INTER_AREA)
+    return image, factor
+
+
+class BoxPipeline:
+    """
+    Image processing pipeline that reuses scratch buffers between images.
+    Edge detection buffers are allocated once and only reallocated when the
+    image size changes, avoiding per-image allocations in batch runs.
+    Not thread-safe; use one pipeline per thread or process.
     
-    # Calculate orientation
-    angle = calculate_orientation(rect)
+    Args:
+        max_edge_size: Downscale images to this longest side before edge
+                       detection (optional, e.g. detect_box.MAX_EDGE_SIZE);
+                       faster, but can change which box is detected
+        reduced_decode: Read very large images at 1/2, 1/4 or 1/8 resolution
+                        (default: False); results are mapped back to original
+                        coordinates, but the annotated image stays reduced
+    """
     
-    # Calculate sticker position
-    sticker_pos = calculate_sticker_position(rect, offset_percent=0.1)
+    def __init__(self, max_edge_size=None, reduced_decode=False):
+        # Scratch buffers for box detection, keyed by name
+        self.buffers = {}
+        self.max_edge_size = max_edge_size
+        self.reduced_decode = reduced_decode
     
-    # If sticker_path not provided, try to find default sticker
-    if sticker_path is None:
-        # Look for sticker in stickers directory relative to script
-        script_dir = Path(__file__).parent.parent
-        default_sticker = script_dir / "stickers" / "sticker.png"
-        if default_sticker.exists():
-            sticker_path = str(default_sticker)
+    def process(self, image_path, output_dir=None, sticker_path=None):
+        """
+        Process a single image and detect sticker placement.
+        
+        Args:
+            image_path: Path to input image
+            output_dir: Directory to save annotated image (optional)
+            sticker_path: Path to sticker image file (optional)
+            
+        Returns:
+            results: Dictionary with angle, position, and annotated image
+                     (position and rect are in original image coordinates; the
+                     annotated image is reduced if reduced_decode is enabled)
+        """
+        # Read image (very large images are reduced if reduced_decode is enabled)
+        if self.reduced_decode:
+            image, factor = _imread_autoscale(image_path)
         else:
-            # Try other common formats
-            for ext in ['.jpg', '.jpeg', '.png', '.bmp']:
-                test_path = script_dir / "stickers" / f"sticker{ext}"
-                if test_path.exists():
-                    sticker_path = str(test_path)
-                    break
-    
-    # Annotate image
-    annotated = annotate_image(image, contour, rect, sticker_pos, angle, sticker_path)
-    
-    # Save annotated image if output directory provided
-    if output_dir:
-        os.makedirs(output_dir, exist_ok=True)
-        filename = os.path.basename(image_path)
-        output_path = os.path.join(output_dir, f"annotated_{filename}")
-        cv2.imwrite(output_path, annotated)
-        print(f"Saved annotated image to: {output_path}")
-    
-    # Print results
-    print(f"\n{'='*50}")
-    print(f"Image: {os.path.basename(image_path)}")
-    if angle is not None:
-        print(f"Box Orientation (x-axis to longer side): {angle:.2f}°")
-    if sticker_pos:
-        print(f"Sticker Coordinates (x, y): ({sticker_pos[0]}, {sticker_pos[1]})")
-    print(f"{'='*50}\n")
+            image, factor = cv2.imread(image_path), 1
+        if image is None:
+            print(f"Error: Could not read image from {image_path}")
+            return None
+        
+        # Detect box
+        contour, rect, edges = detect_box(image, self.buffers, self.max_edge_size)
+        
+        if rect is None:
+            print(f"Warning: No box detected in {image_path}")
+            return None
+        
+        # Compute box corners once and share them across the pipeline
+        corners = get_box_corners(rect)
+        
+        # Calculate orientation
+        angle = calculate_orientation(rect, corners)
+        
+        # Calculate sticker position
+        sticker_pos = calculate_sticker_position(rect, offset_percent=0.1, corners=corners)
+        
+        # If sticker_path not provided, use the default sticker (if any)
+        if sticker_path is None:
+            sticker_path = _default_sticker_path()
+        
+        # Annotate image
+        # The decoded image is not used afterwards, so annotate it in place
+        annotated = annotate_image(image, contour, rect, sticker_pos, angle, sticker_path,
+                                   corners=corners, copy=False, display_scale=factor)
+        
+        # Save annotated image if output directory provided
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+            filename = os.path.basename(image_path)
+            output_path = os.path.join(output_dir, f"annotated_{filename}")
+            cv2.imwrite(output_path, annotated)
+            print(f"Saved annotated image to: {output_path}")
+            if factor != 1:
+                print(f"Note: large input, annotated image saved at 1/{factor} scale")
+        
+        # Map results back to original image coordinates
+        if factor != 1:
+            (cx, cy), (w, h), rect_angle = rect
+            offset = (factor - 1) / 2
+            rect = ((cx * factor + offset, cy * factor + offset), (w * factor, h * factor), rect_angle)
+            if sticker_pos is not None:
+                sticker_pos = _to_original_point(sticker_pos, factor)
+        
+        # Print results
+        print(f"\n{'='*50}")
+        print(f"Image: {os.path.basename(image_path)}")
+        if angle is not None:
+            print(f"Box Orientation (x-axis to longer side): {angle:.2f}°")
+        if sticker_pos:
+            print(f"Sticker Coordinates (x, y): ({sticker_pos[0]}, {sticker_pos[1]})")
+        print(f"{'='*50}\n")
+        
+        return {
+            'angle': angle,
+            'position': sticker_pos,
+            'annotated_image': annotated,
+            'rect': rect
+        }
+
+
+# Per-thread pipelines used by process_image(), so concurrent calls from
+# different threads never share scratch buffers
+_thread_pipelines = threading.local()
+
+
+def _default_pipeline():
+    """
+    Get the calling thread's default pipeline, creating it on first use.
     
-    return {
-        'angle': angle,
-        'position': sticker_pos,
-        'annotated_image': annotated,
-        'rect': rect
-    }
+    Returns:
+        pipeline: BoxPipeline owned by the current thread
+    """
+    pipeline = getattr(_thread_pipelines, 'pipeline', None)
+    if pipeline is None:
+        pipeline = BoxPipeline()
+        _thread_pipelines.pipeline = pipeline
+    return pipeline
+
+
+def process_image(image_path, output_dir=None, sticker_path=None):
+    """
+    Process a single image and detect sticker placement.
+    Uses a per-thread BoxPipeline so buffers are reused across calls; safe to
+    call from several threads.
+    
+    Args:
+        image_path: Path to input image
+        output_dir: Directory to save annotated image (optional)
+        sticker_path: Path to sticker image file (optional)
+        
+    Returns:
+        results: Dictionary with angle, position, and annotated image
+    """
+    return _default_pipeline().process(image_path, output_dir, sticker_path)
+
+
+def _init_worker():
+    """
+    Initialize a process_directory worker process.
+    Each image already gets its own process, so OpenCV is limited to one
+    thread per worker to avoid cpu_count x cpu_count threads competing.
+    """
+    cv2.setNumThreads(1)
+
+
+def _process_image_worker(image_path, output_dir):
+    """
+    Process one image in a worker process.
+    Console output is captured and returned so the parent can print it in
+    order, and the annotated image is not pickled back.
+    
+    Args:
+        image_path: Path to input image
+        output_dir: Directory to save annotated image
+        
+    Returns:
+        success: True if a box was detected and the image processed
+        output: Text printed while processing the image
+    """
+    with io.StringIO() as buffer:
+        with contextlib.redirect_stdout(buffer):
+            success = process_image(image_path, output_dir, sticker_path=None) is not None
+        return success, buffer.getvalue()
 
 
 def process_directory(input_dir, output_dir):
     """
     Process all images in a directory.
+    With more than one image and CPU, images are processed in parallel worker
+    processes; each worker loads the sticker (and compiles the Numba kernel,
+    if available) once. Otherwise they are processed serially in-process.
     
     Args:
         input_dir: Directory containing input images
         output_dir: Directory to save annotated images
     """
-    image_extensions = ['.jpg', '.jpeg', '.png', '.bmp']
+    image_extensions = {'.jpg', '.jpeg', '.png', '.bmp'}
     
-    image_files = []
-    for ext in image_extensions:
-        image_files.extend(Path(input_dir).glob(f"*{ext}"))
-        image_files.extend(Path(input_dir).glob(f"*{ext.upper()}"))
+    # Single directory scan with a case-insensitive extension check
+    with os.scandir(input_dir) as entries:
+        image_files = sorted(
+            entry.path for entry in entries
+            if entry.is_file() and os.path.splitext(entry.name)[1].lower() in image_extensions
+        )
     
     if not image_files:
         print(f"No images found in {input_dir}")
@@ -339,11 +637,32 @@ def process_directory(input_dir, output_dir):
     
     print(f"Found {len(image_files)} image(s) to process\n")
     
-    for image_path in image_files:
-        process_image(str(image_path), output_dir, sticker_path=None)
+    # Images are independent, so process them in parallel across all cores
+    # (no more workers than images, since each worker repeats the sticker load)
+    max_workers = min(os.cpu_count() or 1, len(image_files))
+    failed = 0
+    if max_workers == 1:
+        # A pool would only add process startup and pickling overhead
+        for image_path in image_files:
+            if process_image(image_path, output_dir, sticker_path=None) is None:
+                failed += 1
+    else:
+        worker = functools.partial(_process_image_worker, output_dir=output_dir)
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker) as executor:
+            # Results come back in input order; print each image's output as a block
+            for success, output in executor.map(worker, image_files):
+                print(output, end='')
+                if not success:
+                    failed += 1
+    
+    if failed:
+        print(f"{failed} of {len(image_files)} image(s) could not be processed")
 
 
 if __name__ == "__main__":
+    # Enable OpenCV optimizations for CLI runs
+    configure_opencv()
+    
     # Example usage
     if len(sys.argv) < 2:
         print("Usage: python process_image.py <image_path> [output_dir]")
@@ -3,8 +3,9 @@ Sticker Position Calculation Module
 Determines optimal (x, y) coordinates for sticker placement.
 """
 
+import functools
+
 import numpy as np
-import cv2
 
 # Handle both relative and absolute imports
 try:
@@ -13,7 +14,7 @@ except ImportError:
     from orientation import get_box_center, get_box_corners
 
 
-def calculate_sticker_position(rect, offset_percent=0.25):
+def calculate_sticker_position(rect, offset_percent=0.25, corners=None):
     """
     Calculate sticker placement position on the box.
     Ensures the position is within the box boundaries using geometric constraints.
@@ -21,6 +22,7 @@ def calculate_sticker_position(rect, offset_percent=0.25):
     Args:
         rect: Minimum area rectangle from cv2.minAreaRect()
         offset_percent: Offset from center as percentage (default: 0.25 = 25%)
+        corners: Precomputed box corners from get_box_corners() (optional)
         
     Returns:
         position: Tuple (x, y) for sticker placement (guaranteed to be on box)
@@ -34,7 +36,7 @@ def calculate_sticker_position(rect, offset_percent=0.25):
         return None
     
     cx, cy = center
-    box_corners = get_box_corners(rect)
+    box_corners = corners if corners is not None else get_box_corners(rect)
     
     if box_corners is None:
         return None
@@ -59,25 +61,90 @@ def calculate_sticker_position(rect, offset_percent=0.25):
     # Normalize direction
     direction_unit = direction / direction_length
     
-    # Try different offsets from center, starting with the desired offset
-    # and reducing if needed to ensure we stay inside the box
-    for offset_ratio in np.linspace(offset_percent, 0.05, 30):
-        # Calculate candidate position
-        offset_vec = direction * offset_ratio
-        candidate = center_pt + offset_vec
-        candidate_pt = (int(candidate[0]), int(candidate[1]))
+    # Distance along the ray (center -> top corner) at which it leaves the box
+    t_max = _ray_exit_distance(center_pt, direction_unit, corners)
+    if t_max is None:
+        t_max = direction_length
+    
+    # Offset by the desired amount, but stay inside the box with a small margin
+    # The box is convex and the center is inside, so any t < t_max is on the box
+    offset = min(offset_percent * direction_length, 0.95 * t_max)
+    candidate = center_pt + direction_unit * offset
+    
+    return (int(candidate[0]), int(candidate[1]))
+
+
+def _ray_exit_distance(origin, direction, corners):
+    """
+    Find where a ray starting inside a convex polygon crosses its boundary.
+    
+    Args:
+        origin: Ray start point (x, y)
+        direction: Unit direction vector of the ray
+        corners: Array of polygon corner points, shape (N, 2)
         
-        # Check if this point is inside the box
-        # pointPolygonTest returns: >0 if inside, =0 if on edge, <0 if outside
-        test_result = cv2.pointPolygonTest(box_corners, candidate_pt, True)
+    Returns:
+        t: Smallest positive distance along the ray to an edge, or None if none is hit
+    """
+    kernel = _ray_exit_kernel()
+    t = kernel(float(origin[0]), float(origin[1]),
+               float(direction[0]), float(direction[1]),
+               np.ascontiguousarray(corners, dtype=np.float64))
+    return t if t > 0 else None
+
+
+def _ray_exit_distance_scalar(ox, oy, dx, dy, corners):
+    """
+    Ray/edge intersection core used by _ray_exit_distance.
+    Solves origin + t * direction = A + s * (B - A) for each edge (A, B).
+    Plain scalar loop, so it runs as ordinary Python or compiled by Numba.
+    
+    Args:
+        ox, oy: Ray start point
+        dx, dy: Unit direction vector of the ray
+        corners: Float64 array of polygon corner points, shape (N, 2)
         
-        if test_result >= 0:
-            # Point is inside or on the edge - use it
-            return candidate_pt
+    Returns:
+        t: Smallest positive distance along the ray to an edge, or -1.0 if none is hit
+    """
+    n = corners.shape[0]
+    best = -1.0
+    for i in range(n):
+        ax = corners[i, 0]
+        ay = corners[i, 1]
+        ex = corners[(i + 1) % n, 0] - ax
+        ey = corners[(i + 1) % n, 1] - ay
+        # Ignore edges parallel to the ray
+        denom = dx * ey - dy * ex
+        if abs(denom) <= 1e-9:
+            continue
+        px = ax - ox
+        py = ay - oy
+        t = (px * ey - py * ex) / denom
+        s = (px * dy - py * dx) / denom
+        # Keep intersections in front of the origin and within the edge segment
+        if t > 0 and 0 <= s <= 1 and (best < 0 or t < best):
+            best = t
+    return best
+
+
+@functools.lru_cache(maxsize=1)
+def _ray_exit_kernel():
+    """
+    Get the ray/edge intersection kernel, JIT-compiling it on first use.
+    Numba is optional and imported lazily so it does not slow down module import;
+    without it the plain Python loop is used.
+    
+    Returns:
+        kernel: Callable with the signature of _ray_exit_distance_scalar
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return _ray_exit_distance_scalar
     
-    # If we couldn't find a point (shouldn't happen), use center
-    # Center is always inside a convex polygon
-    return (int(cx), int(cy))
+    # cache=True keeps the compiled code in __pycache__ so later runs skip the JIT
+    return njit(cache=True, fastmath=True)(_ray_exit_distance_scalar)
 
 
 def calculate_sticker_position_on_face(rect, face='top', offset_percent=0.1):